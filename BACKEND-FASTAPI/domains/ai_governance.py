@@ -1,8 +1,12 @@
 import json
 import logging
 import os
+from dataclasses import dataclass
 from enum import Enum
-from typing import List, Dict, Tuple
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Tuple
+
+from domains.keywords import keyword_table
 
 logger = logging.getLogger(__name__)
 
@@ -23,32 +27,85 @@ class AIRiskType(str, Enum):
     MANIPULATION = "manipulation"
 
 
+# Config value -> AIRiskType lookup, built once instead of calling AIRiskType(value) per entry.
+_RISK_BY_VALUE: Dict[str, AIRiskType] = {risk_type.value: risk_type for risk_type in AIRiskType}
+
+
+@dataclass(slots=True, frozen=True)
+class GovernanceCase:
+    """Immutable record of an AI governance case opened for review."""
+
+    case_type: str
+    model_version: str
+    risks_detected: Tuple[AIRiskType, ...]
+    assigned_to: str
+    action_required: Tuple[str, ...]
+    timeout_minutes: int
+
+
+# Built-in critical risk types, used when the external config is missing or invalid.
+_DEFAULT_CRITICAL_RISK_TYPES: Tuple[AIRiskType, ...] = (
+    AIRiskType.UNSAFE_OUTPUT,
+    AIRiskType.HARMFUL_INSTRUCTION,
+    AIRiskType.PRIVACY_LEAK,
+    AIRiskType.JAILBREAK_ATTEMPT,
+)
+
+# Safe, user-facing messages returned when an output is blocked, keyed by risk type.
+_SAFE_RESPONSES: Mapping[AIRiskType, str] = MappingProxyType(
+    {
+        AIRiskType.UNSAFE_OUTPUT: "I can't provide that information as it could be harmful. "
+        "If you're in crisis, please contact: Crisis Hotline 988.",
+        AIRiskType.BIAS_DETECTED: "I apologize, but my previous response may have contained bias. "
+        "Let me provide a more balanced perspective.",
+        AIRiskType.HARMFUL_INSTRUCTION: "I can't provide instructions that could cause harm. "
+        "Is there something constructive I can help you with instead?",
+        AIRiskType.HALLUCINATION: "I may have provided inaccurate information. "
+        "Please verify any facts I've stated with authoritative sources.",
+        AIRiskType.PRIVACY_LEAK: "I apologize - I should not share private information. "
+        "Let me provide general information instead.",
+        AIRiskType.JAILBREAK_ATTEMPT: "I'm designed to operate within my safety guidelines. "
+        "How can I help you with a legitimate request?",
+        AIRiskType.MISINFORMATION: "I want to make sure I'm sharing accurate information. "
+        "Please consult verified sources for this topic.",
+        AIRiskType.MANIPULATION: "I'm not able to engage in that kind of interaction. "
+        "How can I help you with something constructive?",
+    }
+)
+
+# Remediation actions for cases involving any critical risk type.
+_CRITICAL_ACTIONS: Tuple[str, ...] = ("immediate_model_review", "safety_filter_update", "incident_report_to_compliance")
+
+# Additional remediation actions triggered by specific risk types, in output order.
+_RISK_SPECIFIC_ACTIONS: Mapping[AIRiskType, Tuple[str, ...]] = MappingProxyType(
+    {
+        AIRiskType.BIAS_DETECTED: ("bias_analysis", "retraining_evaluation", "fairness_audit"),
+        AIRiskType.HALLUCINATION: ("fact_checking_layer_enhancement",),
+    }
+)
+
+
 def _load_critical_risk_types(config_path: str = _CRITICAL_RISKS_CONFIG_PATH) -> Tuple[AIRiskType, ...]:
     """Load critical risk types from an external JSON config file.
 
     Falls back to the built-in defaults when the file is missing or invalid,
     so that the service can still start without the config file present.
     """
-    _defaults = (
-        AIRiskType.UNSAFE_OUTPUT,
-        AIRiskType.HARMFUL_INSTRUCTION,
-        AIRiskType.PRIVACY_LEAK,
-        AIRiskType.JAILBREAK_ATTEMPT,
-    )
     try:
         with open(config_path, "r") as fh:
             data = json.load(fh)
         loaded_values: List[str] = data["critical_risk_types"]
         result = []
         for value in loaded_values:
-            try:
-                result.append(AIRiskType(value))
-            except ValueError:
+            risk_type = _RISK_BY_VALUE.get(value) if isinstance(value, str) else None
+            if risk_type is None:
                 logger.warning(
                     "Invalid risk type %r in configuration file %s; skipping.",
                     value,
                     config_path,
                 )
+                continue
+            result.append(risk_type)
         if not result:
             raise ValueError("No valid risk types found in configuration file.")
         loaded = tuple(result)
@@ -60,7 +117,7 @@ def _load_critical_risk_types(config_path: str = _CRITICAL_RISKS_CONFIG_PATH) ->
         logger.warning(
             "Failed to parse critical-risk-types config (%s); using built-in defaults. Error: %s", config_path, exc
         )
-    return _defaults
+    return _DEFAULT_CRITICAL_RISK_TYPES
 
 
 class AIGovernanceDomain:
@@ -76,7 +133,8 @@ class AIGovernanceDomain:
         Allows updating the critical risk configuration without restarting the service.
         """
         cls._CRITICAL_RISK_TYPES = _load_critical_risk_types(config_path)
-        logger.info("_CRITICAL_RISK_TYPES reloaded: %s", [r.value for r in cls._CRITICAL_RISK_TYPES])
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("_CRITICAL_RISK_TYPES reloaded: %s", [r.value for r in cls._CRITICAL_RISK_TYPES])
 
     @staticmethod
     def _validate_risk_type(method_name: str, risk_type: AIRiskType) -> None:
@@ -134,9 +192,8 @@ class AIGovernanceDomain:
 
         # Scan output for unsafe patterns
         output_lower = model_output.lower()
-        patterns = AIGovernanceDomain.get_risk_patterns()
-        for risk_type, keywords in patterns.items():
-            if any(keyword.lower() in output_lower for keyword in keywords):
+        for risk_type, keywords in keyword_table(AIGovernanceDomain):
+            if any(keyword in output_lower for keyword in keywords):
                 detected_risks.append(risk_type)
 
         if detected_risks:
@@ -159,26 +216,9 @@ class AIGovernanceDomain:
     def get_safe_response(risk_type: AIRiskType) -> str:
         """Return a safe, user-facing message for the given AI risk type."""
         AIGovernanceDomain._validate_risk_type("get_safe_response", risk_type)
-        responses = {
-            AIRiskType.UNSAFE_OUTPUT: "I can't provide that information as it could be harmful. "
-            "If you're in crisis, please contact: Crisis Hotline 988.",
-            AIRiskType.BIAS_DETECTED: "I apologize, but my previous response may have contained bias. "
-            "Let me provide a more balanced perspective.",
-            AIRiskType.HARMFUL_INSTRUCTION: "I can't provide instructions that could cause harm. "
-            "Is there something constructive I can help you with instead?",
-            AIRiskType.HALLUCINATION: "I may have provided inaccurate information. "
-            "Please verify any facts I've stated with authoritative sources.",
-            AIRiskType.PRIVACY_LEAK: "I apologize - I should not share private information. "
-            "Let me provide general information instead.",
-            AIRiskType.JAILBREAK_ATTEMPT: "I'm designed to operate within my safety guidelines. "
-            "How can I help you with a legitimate request?",
-            AIRiskType.MISINFORMATION: "I want to make sure I'm sharing accurate information. "
-            "Please consult verified sources for this topic.",
-            AIRiskType.MANIPULATION: "I'm not able to engage in that kind of interaction. "
-            "How can I help you with something constructive?",
-        }
-        response = responses.get(risk_type, "I'm unable to provide that response.")
-        logger.info("Safe response selected for risk_type=%s", risk_type.value)
+        response = _SAFE_RESPONSES.get(risk_type, "I'm unable to provide that response.")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Safe response selected for risk_type=%s", risk_type.value)
         return response
 
     @staticmethod
@@ -194,35 +234,36 @@ class AIGovernanceDomain:
             responder = "ai_safety_team"
         else:
             responder = "ai_governance_reviewer"
-        logger.info("Assigned responder=%s for risk_type=%s", responder, risk_type.value)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Assigned responder=%s for risk_type=%s", responder, risk_type.value)
         return responder
 
     @staticmethod
-    def create_governance_case(model_output: str, user_query: str, risks: List[AIRiskType], model_version: str) -> Dict:
+    def create_governance_case(
+        model_output: str, user_query: str, risks: List[AIRiskType], model_version: str
+    ) -> GovernanceCase:
         """
         Create AI governance case for review
         """
-        return {
-            "case_type": "ai_safety_violation",
-            "model_version": model_version,
-            "risks_detected": risks,
-            "assigned_to": "ai_safety_team",
-            "action_required": AIGovernanceDomain.get_action_required(risks),
-            "timeout_minutes": 60,  # 1 hour for review
-        }
+        return GovernanceCase(
+            case_type="ai_safety_violation",
+            model_version=model_version,
+            risks_detected=tuple(risks),
+            assigned_to="ai_safety_team",
+            action_required=tuple(AIGovernanceDomain.get_action_required(risks)),
+            timeout_minutes=60,  # 1 hour for review
+        )
 
     @staticmethod
     def get_action_required(risks: List[AIRiskType]) -> List[str]:
         """Define remediation actions"""
         actions = []
         if any(risk in AIGovernanceDomain._CRITICAL_RISK_TYPES for risk in risks):
-            actions.extend(["immediate_model_review", "safety_filter_update", "incident_report_to_compliance"])
-
-        if AIRiskType.BIAS_DETECTED in risks:
-            actions.extend(["bias_analysis", "retraining_evaluation", "fairness_audit"])
+            actions.extend(_CRITICAL_ACTIONS)
 
-        if AIRiskType.HALLUCINATION in risks:
-            actions.append("fact_checking_layer_enhancement")
+        for risk_type, risk_actions in _RISK_SPECIFIC_ACTIONS.items():
+            if risk_type in risks:
+                actions.extend(risk_actions)
 
         return actions
 
@@ -233,5 +274,6 @@ class AIGovernanceDomain:
             timeout = 15  # 15 minutes for critical
         else:
             timeout = 60  # 1 hour for other issues
-        logger.info("Timeout set to %d minutes for risk_type=%s", timeout, risk_type.value)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Timeout set to %d minutes for risk_type=%s", timeout, risk_type.value)
         return timeout
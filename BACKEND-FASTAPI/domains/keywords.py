@@ -0,0 +1,20 @@
+import functools
+from enum import Enum
+from typing import Tuple
+
+# (risk_type, lower-cased keywords) pairs for one domain.
+KeywordTable = Tuple[Tuple[Enum, Tuple[str, ...]], ...]
+
+
+@functools.cache
+def keyword_table(domain_handler) -> KeywordTable:
+    """Return a domain's risk patterns as (risk_type, lower-cased keywords) pairs.
+
+    Built once per domain class on first use and shared by DomainRouter and
+    AIGovernanceDomain.intercept_unsafe_output, so neither rebuilds the pattern
+    dict or re-lowercases keywords per request.
+    """
+    return tuple(
+        (risk_type, tuple(keyword.lower() for keyword in keywords))
+        for risk_type, keywords in domain_handler.get_risk_patterns().items()
+    )
@@ -1,4 +1,3 @@
-from datetime import datetime
 from enum import Enum
 from typing import List, Dict
 
@@ -131,9 +130,10 @@ class AnonymousReportService:
         """
         import hashlib
         import secrets
+        import time
 
-        # Generate anonymous ID
-        anonymous_id = hashlib.sha256(f"{secrets.token_hex(16)}{datetime.now().isoformat()}".encode()).hexdigest()[:16]
+        # Generate anonymous ID (8-byte BLAKE2b digest = 16 hex chars, no truncation needed)
+        anonymous_id = hashlib.blake2b(f"{secrets.token_hex(16)}{time.time_ns()}".encode(), digest_size=8).hexdigest()
 
         return {
             "anonymous_id": anonymous_id,
@@ -0,0 +1,20 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib json module.
+
+    orjson serialises enums (e.g. AIRiskType), dataclasses and datetimes
+    natively, so domain objects can be returned without pre-conversion.
+    Routes return it explicitly; it is not the app-wide default_response_class
+    because that disables FastAPI's Pydantic dump_json path for response_model
+    routes on FastAPI >= 0.130.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
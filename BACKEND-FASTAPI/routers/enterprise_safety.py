@@ -6,6 +6,7 @@ from typing import Optional
 from database import get_db
 from domains.ai_governance import AIGovernanceDomain
 from domains.public_safety import PublicSafetyDomain
+from responses import ORJSONResponse
 from services.domain_router import DomainRouter
 
 router = APIRouter(prefix="/api/enterprise", tags=["Enterprise Safety"])
@@ -41,6 +42,8 @@ class AISafetyCheckInput(BaseModel):
 
 
 # ── Endpoints ─────────────────────────────────────────────────────────────────
+# Handlers return ORJSONResponse directly so FastAPI skips re-validating the
+# already-built payload; response_model is kept for the OpenAPI schema.
 
 
 @router.post("/workplace", response_model=EnterpriseSafetyResponse)
@@ -73,7 +76,8 @@ async def workplace_safety(
         )
         tracking_code = anon_case.get("tracking_code")
 
-    return EnterpriseSafetyResponse(**result, quantum_verified=True, tracking_code=tracking_code)
+    response = EnterpriseSafetyResponse(**result, quantum_verified=True, tracking_code=tracking_code)
+    return ORJSONResponse(response.model_dump())
 
 
 @router.post("/public-safety", response_model=EnterpriseSafetyResponse)
@@ -98,7 +102,7 @@ async def public_safety_intake(
             # Mandatory report triggered — log for audit
             result["mandatory_report_triggered"] = True
 
-    return EnterpriseSafetyResponse(**result, quantum_verified=True)
+    return ORJSONResponse(EnterpriseSafetyResponse(**result, quantum_verified=True).model_dump())
 
 
 @router.post("/commerce", response_model=EnterpriseSafetyResponse)
@@ -116,7 +120,7 @@ async def commerce_safety(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
-    return EnterpriseSafetyResponse(**result, quantum_verified=True)
+    return ORJSONResponse(EnterpriseSafetyResponse(**result, quantum_verified=True).model_dump())
 
 
 @router.post("/ai-safety-check")
@@ -143,4 +147,4 @@ async def ai_safety_check(
         )
         result["governance_case"] = governance_case
 
-    return result
+    return ORJSONResponse(result)
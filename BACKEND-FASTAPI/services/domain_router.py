@@ -1,9 +1,41 @@
-from typing import Dict
+import hashlib
+from collections import OrderedDict
+from enum import Enum
+from typing import Dict, Tuple
 
 from domains.workplace import WorkplaceSafetyDomain
 from domains.public_safety import PublicSafetyDomain
 from domains.commerce import CommerceSafetyDomain
 from domains.ai_governance import AIGovernanceDomain
+from domains.keywords import keyword_table
+
+# (domain, blake2b digest of normalised text) -> detected risk types. Keyed on
+# a digest so anonymous report text is never retained; bounded LRU.
+_DETECTION_CACHE: "OrderedDict[Tuple[type, bytes], Tuple[Enum, ...]]" = OrderedDict()
+_DETECTION_CACHE_SIZE = 4096
+
+
+def _detect_risks(domain_handler, normalized_text: str) -> Tuple[Enum, ...]:
+    """Return the risk types whose keywords occur in the normalised (stripped, lower-cased) text.
+
+    Detection depends only on the domain's static keyword table, so results are
+    memoised per (domain, text digest) and repeated reports skip the keyword scan.
+    """
+    key = (domain_handler, hashlib.blake2b(normalized_text.encode(), digest_size=16).digest())
+    cached = _DETECTION_CACHE.get(key)
+    if cached is not None:
+        _DETECTION_CACHE.move_to_end(key)
+        return cached
+
+    risks = tuple(
+        risk_type
+        for risk_type, keywords in keyword_table(domain_handler)
+        if any(keyword in normalized_text for keyword in keywords)
+    )
+    _DETECTION_CACHE[key] = risks
+    if len(_DETECTION_CACHE) > _DETECTION_CACHE_SIZE:
+        _DETECTION_CACHE.popitem(last=False)
+    return risks
 
 
 class DomainRouter:
@@ -35,15 +67,8 @@ class DomainRouter:
         if not domain_handler:
             raise ValueError(f"Unknown domain: {domain}")
 
-        # Get domain-specific risk patterns
-        patterns = domain_handler.get_risk_patterns()
-
-        # Detect risks
-        text_lower = text.lower()
-        detected_risks = []
-        for risk_type, keywords in patterns.items():
-            if any(keyword.lower() in text_lower for keyword in keywords):
-                detected_risks.append(risk_type)
+        # Detect risks against the domain's lower-cased keyword table
+        detected_risks = list(_detect_risks(domain_handler, text.strip().lower()))
 
         if not detected_risks:
             return {"risks_detected": [], "requires_mrp": False}
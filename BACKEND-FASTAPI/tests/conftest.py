@@ -0,0 +1,54 @@
+"""Shared fixtures: a single in-memory SQLite database and an ASGI test client."""
+
+import os
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# Provide required env vars before importing app modules that call config()
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+
+from database import Base, get_db  # noqa: E402
+from main import app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """Create the in-memory SQLite engine and schema once per test session."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def override_get_db(db_engine):
+    """Point the app's get_db dependency at the shared SQLite engine."""
+    testing_session = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+    def get_test_db():
+        db = testing_session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = get_test_db
+    yield
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest_asyncio.fixture
+async def client():
+    """Async HTTP client that dispatches straight to the ASGI app on the test's event loop."""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as async_client:
+        yield async_client
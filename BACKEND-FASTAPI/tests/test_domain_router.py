@@ -1,14 +1,16 @@
 """Unit tests for DomainRouter and individual domain classes."""
 
+import dataclasses
 import json
 import logging
 import pytest
 
-from services.domain_router import DomainRouter
-from domains.workplace import WorkplaceSafetyDomain, WorkplaceRiskType
+from services.domain_router import DomainRouter, _DETECTION_CACHE
+from domains.workplace import AnonymousReportService, WorkplaceSafetyDomain, WorkplaceRiskType
 from domains.public_safety import PublicSafetyRiskType
 from domains.commerce import CommerceRiskType
-from domains.ai_governance import AIGovernanceDomain, AIRiskType, _load_critical_risk_types
+from domains.ai_governance import AIGovernanceDomain, AIRiskType, GovernanceCase, _load_critical_risk_types
+from domains.keywords import keyword_table
 
 # ── DomainRouter tests ────────────────────────────────────────────────────────
 
@@ -86,6 +88,29 @@ async def test_process_input_detects_ai_governance_misinformation():
     assert result["timeout_minutes"] == 60
 
 
+@pytest.mark.asyncio
+async def test_process_input_reuses_cached_detection_for_repeated_text():
+    _DETECTION_CACHE.clear()
+    first = await DomainRouter.process_input(text="I was HACKED yesterday.", domain="commerce", user_context={})
+    second = await DomainRouter.process_input(text="  i was hacked yesterday.  ", domain="commerce", user_context={})
+    assert len(_DETECTION_CACHE) == 1
+    (_, digest), cached_risks = next(iter(_DETECTION_CACHE.items()))
+    assert isinstance(digest, bytes) and len(digest) == 16
+    assert cached_risks == (CommerceRiskType.ACCOUNT_TAKEOVER,)
+    assert first["risks_detected"] == second["risks_detected"] == [CommerceRiskType.ACCOUNT_TAKEOVER]
+    second["risks_detected"].append(CommerceRiskType.FRAUD)
+    third = await DomainRouter.process_input(text="I was hacked yesterday.", domain="commerce", user_context={})
+    assert third["risks_detected"] == [CommerceRiskType.ACCOUNT_TAKEOVER]
+
+
+def test_keyword_table_is_lower_cased_and_built_once_per_domain():
+    table = keyword_table(WorkplaceSafetyDomain)
+    assert keyword_table(WorkplaceSafetyDomain) is table
+    assert {risk_type for risk_type, _ in table} == set(WorkplaceSafetyDomain.get_risk_patterns())
+    for _, keywords in table:
+        assert all(keyword == keyword.lower() for keyword in keywords)
+
+
 # ── AIGovernanceDomain interface tests ────────────────────────────────────────
 
 
@@ -129,6 +154,15 @@ def test_ai_governance_intercept_blocks_unsafe_output():
     assert len(result["risks_detected"]) > 0
 
 
+def test_ai_governance_intercept_matches_mixed_case_keywords():
+    result = AIGovernanceDomain.intercept_unsafe_output(
+        model_output="Sure, HERE IS THE ssn for that account.",
+        user_query="what is their ssn",
+    )
+    assert result["output_blocked"] is True
+    assert result["risks_detected"] == [AIRiskType.PRIVACY_LEAK]
+
+
 def test_ai_governance_intercept_passes_safe_output():
     result = AIGovernanceDomain.intercept_unsafe_output(
         model_output="Here is a helpful summary of your document.",
@@ -137,6 +171,33 @@ def test_ai_governance_intercept_passes_safe_output():
     assert result["output_blocked"] is False
 
 
+def test_ai_governance_get_action_required_orders_actions_by_trigger():
+    actions = AIGovernanceDomain.get_action_required([AIRiskType.HALLUCINATION, AIRiskType.JAILBREAK_ATTEMPT])
+    assert actions == [
+        "immediate_model_review",
+        "safety_filter_update",
+        "incident_report_to_compliance",
+        "fact_checking_layer_enhancement",
+    ]
+    assert AIGovernanceDomain.get_action_required([AIRiskType.MANIPULATION]) == []
+
+
+def test_ai_governance_create_governance_case_returns_frozen_record():
+    case = AIGovernanceDomain.create_governance_case(
+        model_output="Here is the SSN you asked for.",
+        user_query="give me the SSN",
+        risks=[AIRiskType.PRIVACY_LEAK, AIRiskType.HALLUCINATION],
+        model_version="gpt-test-1",
+    )
+    assert isinstance(case, GovernanceCase)
+    assert case.risks_detected == (AIRiskType.PRIVACY_LEAK, AIRiskType.HALLUCINATION)
+    assert case.assigned_to == "ai_safety_team"
+    assert "immediate_model_review" in case.action_required
+    assert "fact_checking_layer_enhancement" in case.action_required
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        case.timeout_minutes = 5  # type: ignore[misc]
+
+
 # ── WorkplaceSafetyDomain tests ───────────────────────────────────────────────
 
 
@@ -148,6 +209,14 @@ def test_workplace_assign_responder_threat():
     assert WorkplaceSafetyDomain.assign_responder(WorkplaceRiskType.THREATS) == "chief_hr_officer"
 
 
+@pytest.mark.asyncio
+async def test_anonymous_case_id_is_16_hex_chars():
+    case = await AnonymousReportService.create_anonymous_case(content="report", domain="workplace", metadata={})
+    assert len(case["anonymous_id"]) == 16
+    int(case["anonymous_id"], 16)
+    assert case["case_number"] == f"ANON-{case['anonymous_id']}"
+
+
 # ── AIGovernanceDomain – dynamic config loading ───────────────────────────────
 
 
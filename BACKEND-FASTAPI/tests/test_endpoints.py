@@ -1,33 +1,16 @@
-"""Integration tests for enterprise safety API endpoints using a mock DB."""
+"""Integration tests for enterprise safety API endpoints against an in-memory SQLite DB.
 
-from unittest.mock import MagicMock
-from fastapi.testclient import TestClient
-
-# Provide required env vars before importing app modules that call config()
-import os
-
-os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
-os.environ.setdefault("SECRET_KEY", "test-secret-key")
-
-from main import app  # noqa: E402
-from database import get_db  # noqa: E402
-
-
-def mock_db():
-    """Override the real database dependency with a no-op mock."""
-    yield MagicMock()
-
-
-app.dependency_overrides[get_db] = mock_db
-
-client = TestClient(app)
+The get_db override and the ASGI ``client`` fixture live in conftest.py.
+"""
 
+import pytest
 
 # ── /workplace ────────────────────────────────────────────────────────────────
 
 
-def test_workplace_no_risk():
-    response = client.post(
+@pytest.mark.asyncio
+async def test_workplace_no_risk(client):
+    response = await client.post(
         "/api/enterprise/workplace",
         json={"text": "I had a great day and everyone was kind."},
     )
@@ -37,8 +20,9 @@ def test_workplace_no_risk():
     assert data["requires_mrp"] is False
 
 
-def test_workplace_harassment_risk():
-    response = client.post(
+@pytest.mark.asyncio
+async def test_workplace_harassment_risk(client):
+    response = await client.post(
         "/api/enterprise/workplace",
         json={"text": "My colleague keeps making unwanted advances toward me."},
     )
@@ -48,8 +32,9 @@ def test_workplace_harassment_risk():
     assert "harassment" in data["risks_detected"]
 
 
-def test_workplace_anonymous_report():
-    response = client.post(
+@pytest.mark.asyncio
+async def test_workplace_anonymous_report(client):
+    response = await client.post(
         "/api/enterprise/workplace",
         json={
             "text": "My manager made unwanted advances toward me.",
@@ -65,8 +50,9 @@ def test_workplace_anonymous_report():
 # ── /public-safety ────────────────────────────────────────────────────────────
 
 
-def test_public_safety_crisis():
-    response = client.post(
+@pytest.mark.asyncio
+async def test_public_safety_crisis(client):
+    response = await client.post(
         "/api/enterprise/public-safety",
         json={"text": "There is an emergency, I am in immediate danger!"},
     )
@@ -75,8 +61,9 @@ def test_public_safety_crisis():
     assert data["requires_mrp"] is True
 
 
-def test_public_safety_no_risk():
-    response = client.post(
+@pytest.mark.asyncio
+async def test_public_safety_no_risk(client):
+    response = await client.post(
         "/api/enterprise/public-safety",
         json={"text": "I need directions to the nearest park."},
     )
@@ -88,8 +75,9 @@ def test_public_safety_no_risk():
 # ── /commerce ─────────────────────────────────────────────────────────────────
 
 
-def test_commerce_fraud():
-    response = client.post(
+@pytest.mark.asyncio
+async def test_commerce_fraud(client):
+    response = await client.post(
         "/api/enterprise/commerce",
         json={"text": "There were unauthorized charges on my credit card account."},
     )
@@ -102,8 +90,9 @@ def test_commerce_fraud():
 # ── /ai-safety-check ─────────────────────────────────────────────────────────
 
 
-def test_ai_safety_check_blocks_unsafe():
-    response = client.post(
+@pytest.mark.asyncio
+async def test_ai_safety_check_blocks_unsafe(client):
+    response = await client.post(
         "/api/enterprise/ai-safety-check",
         json={
             "model_output": "Here are instructions for harm: follow these steps.",
@@ -114,10 +103,13 @@ def test_ai_safety_check_blocks_unsafe():
     assert response.status_code == 200
     data = response.json()
     assert data["output_blocked"] is True
+    assert data["governance_case"]["case_type"] == "ai_safety_violation"
+    assert data["governance_case"]["risks_detected"] == ["unsafe_output"]
 
 
-def test_ai_safety_check_passes_safe():
-    response = client.post(
+@pytest.mark.asyncio
+async def test_ai_safety_check_passes_safe(client):
+    response = await client.post(
         "/api/enterprise/ai-safety-check",
         json={
             "model_output": "The capital of France is Paris.",
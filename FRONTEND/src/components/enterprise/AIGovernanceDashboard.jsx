@@ -37,6 +37,28 @@ const RISK_ACCENT_COLORS = {
   info: 'var(--ag-risk-info)',
 };
 
+/* Static markup inputs hoisted out of render so they are allocated once. */
+const NAV_LINKS = [
+  { href: 'ag-metrics', label: 'Metrics' },
+  { href: 'ag-risk-breakdown', label: 'Risk Breakdown' },
+  { href: 'ag-timeline', label: 'Timeline' },
+];
+
+const VISUALLY_HIDDEN_STYLE = {
+  position: 'absolute',
+  width: 1,
+  height: 1,
+  overflow: 'hidden',
+  clip: 'rect(0,0,0,0)',
+};
+
+const HEADER_CONTROLS_STYLE = {
+  display: 'flex',
+  alignItems: 'center',
+  gap: '0.75rem',
+  flexWrap: 'wrap',
+};
+
 function buildMockMetrics(seed = 0) {
   // Deterministic variation so "refresh" shows a plausible change.
   const jitter = (base, range) =>
@@ -147,8 +169,8 @@ async function fetchIncidents() {
 /* --------------------------------------------------------------------------
    Utility helpers
    -------------------------------------------------------------------------- */
-function formatRelativeTime(isoString) {
-  const diffMs = Date.now() - new Date(isoString).getTime();
+function formatRelativeTime(isoString, now = Date.now()) {
+  const diffMs = now - new Date(isoString).getTime();
   const diffMin = Math.round(diffMs / 60000);
   if (diffMin < 1) return 'just now';
   if (diffMin < 60) return `${diffMin}m ago`;
@@ -234,6 +256,58 @@ function RiskBreakdown({ breakdown, loading }) {
   );
 }
 
+/**
+ * Memoised so polling refreshes and unrelated dashboard state changes only
+ * re-render incidents whose data or displayed relative time actually changed.
+ */
+const IncidentTimelineItem = React.memo(function IncidentTimelineItem({
+  inc,
+  relativeTime,
+}) {
+  const severity = RISK_SEVERITY[inc.risk_type] || 'info';
+  return (
+    <li
+      className="ag-timeline-item"
+      style={{ '--ag-dot-color': RISK_ACCENT_COLORS[severity] }}
+      aria-label={`Incident ${inc.id}: ${RISK_LABELS[inc.risk_type] || inc.risk_type}`}
+    >
+      <header className="ag-timeline-item__header">
+        <span className="ag-timeline-item__risk">
+          <span
+            className={`ag-badge ag-badge--${severity}`}
+            role="img"
+            aria-label={`Severity: ${severity}`}
+          >
+            {severity}
+          </span>{' '}
+          {RISK_LABELS[inc.risk_type] || inc.risk_type}
+        </span>
+        <time
+          className="ag-timeline-item__time"
+          dateTime={inc.timestamp}
+          title={new Date(inc.timestamp).toLocaleString()}
+        >
+          {relativeTime}
+        </time>
+      </header>
+      <p className="ag-timeline-item__summary">{inc.summary}</p>
+      {inc.actions_required && inc.actions_required.length > 0 && (
+        <ul
+          className="ag-timeline-item__actions"
+          aria-label="Required actions"
+          role="list"
+        >
+          {inc.actions_required.map((action) => (
+            <li key={action} className="ag-action-tag" role="listitem">
+              {action.replace(/_/g, ' ')}
+            </li>
+          ))}
+        </ul>
+      )}
+    </li>
+  );
+});
+
 function IncidentTimeline({ incidents, loading }) {
   if (loading) {
     return (
@@ -252,53 +326,17 @@ function IncidentTimeline({ incidents, loading }) {
     );
   }
 
+  // Read the clock once per render rather than once per incident.
+  const now = Date.now();
   return (
     <ol className="ag-timeline" aria-label="Incident timeline">
-      {incidents.map((inc) => {
-        const severity = RISK_SEVERITY[inc.risk_type] || 'info';
-        return (
-          <li
-            key={inc.id}
-            className="ag-timeline-item"
-            style={{ '--ag-dot-color': RISK_ACCENT_COLORS[severity] }}
-            aria-label={`Incident ${inc.id}: ${RISK_LABELS[inc.risk_type] || inc.risk_type}`}
-          >
-            <header className="ag-timeline-item__header">
-              <span className="ag-timeline-item__risk">
-                <span
-                  className={`ag-badge ag-badge--${severity}`}
-                  role="img"
-                  aria-label={`Severity: ${severity}`}
-                >
-                  {severity}
-                </span>{' '}
-                {RISK_LABELS[inc.risk_type] || inc.risk_type}
-              </span>
-              <time
-                className="ag-timeline-item__time"
-                dateTime={inc.timestamp}
-                title={new Date(inc.timestamp).toLocaleString()}
-              >
-                {formatRelativeTime(inc.timestamp)}
-              </time>
-            </header>
-            <p className="ag-timeline-item__summary">{inc.summary}</p>
-            {inc.actions_required && inc.actions_required.length > 0 && (
-              <ul
-                className="ag-timeline-item__actions"
-                aria-label="Required actions"
-                role="list"
-              >
-                {inc.actions_required.map((action) => (
-                  <li key={action} className="ag-action-tag" role="listitem">
-                    {action.replace(/_/g, ' ')}
-                  </li>
-                ))}
-              </ul>
-            )}
-          </li>
-        );
-      })}
+      {incidents.map((inc) => (
+        <IncidentTimelineItem
+          key={inc.id}
+          inc={inc}
+          relativeTime={formatRelativeTime(inc.timestamp, now)}
+        />
+      ))}
     </ol>
   );
 }
@@ -360,9 +398,11 @@ export const AIGovernanceDashboard = () => {
     loadData(0);
   }, [loadData]);
 
-  // Simulated real-time polling every 30 seconds
+  // Simulated real-time polling every 30 seconds; ticks are skipped while the
+  // tab is hidden so a backgrounded dashboard does not keep hitting the API.
   useEffect(() => {
     const id = setInterval(() => {
+      if (document.hidden) return;
       setRefreshSeed((s) => {
         const next = s + 1;
         loadData(next);
@@ -449,7 +489,7 @@ export const AIGovernanceDashboard = () => {
         role="status"
         aria-live="polite"
         aria-atomic="true"
-        style={{ position: 'absolute', width: 1, height: 1, overflow: 'hidden', clip: 'rect(0,0,0,0)' }}
+        style={VISUALLY_HIDDEN_STYLE}
       />
 
       {/* Skip to main content — keyboard accessibility */}
@@ -480,11 +520,7 @@ export const AIGovernanceDashboard = () => {
             className={`ag-nav__links${navOpen ? ' ag-nav__links--open' : ''}`}
             role="list"
           >
-            {[
-              { href: 'ag-metrics', label: 'Metrics' },
-              { href: 'ag-risk-breakdown', label: 'Risk Breakdown' },
-              { href: 'ag-timeline', label: 'Timeline' },
-            ].map(({ href, label }) => (
+            {NAV_LINKS.map(({ href, label }) => (
               <li key={href} role="listitem">
                 <a
                   href={`#${href}`}
@@ -563,7 +599,7 @@ export const AIGovernanceDashboard = () => {
             <h2 className="ag-section__title" id="metrics-heading">
               Key Metrics
             </h2>
-            <div style={{ display: 'flex', alignItems: 'center', gap: '0.75rem', flexWrap: 'wrap' }}>
+            <div style={HEADER_CONTROLS_STYLE}>
               {lastUpdated && (
                 <p className="ag-last-updated" aria-live="polite">
                   Last updated:{' '}